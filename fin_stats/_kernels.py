@@ -0,0 +1,48 @@
+"""Numeric kernels for the statement ratios.
+
+Compiled with numba when it is installed (the ``speed`` extra); otherwise
+the plain NumPy definitions below are used as-is.
+"""
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _two_period_mean(arr: np.ndarray) -> np.ndarray:
+    # Mean of each year with the year before it. Inputs arrive in Yahoo's
+    # latest-first order, so element i pairs with the older element i+1 and
+    # the result is aligned to index[:-1] (the oldest year has no
+    # predecessor and is dropped).
+    return 0.5 * (arr[:-1] + arr[1:])
+
+
+def bang_for_buck_kernel(rev, ni, ta, tse):
+    # ta_avg feeds both asset turnover and leverage; average it once.
+    ta_avg = _two_period_mean(ta)
+    # Profitability has no rolling component, so it covers every reported
+    # year including the oldest; the other ratios lose that year to the
+    # two-period mean.
+    profitability = ni / rev
+    asset_turn_over = rev[:-1] / ta_avg
+    financial_leverage = ta_avg / _two_period_mean(tse)
+    return_on_equity = profitability[:-1] * asset_turn_over * financial_leverage
+    return profitability, asset_turn_over, financial_leverage, return_on_equity
+
+
+def cash_conversion_kernel(cor, rev, inv, nr, ap):
+    # Cost of revenue is the numerator for both inventory and payable days.
+    cor_cur = cor[:-1]
+    inventory_days = 365.0 / (cor_cur / _two_period_mean(inv))
+    receivable_days = 365.0 / (rev[:-1] / _two_period_mean(nr))
+    payable_days = 365.0 / (cor_cur / _two_period_mean(ap))
+    return inventory_days + receivable_days - payable_days
+
+
+if numba is not None:
+    _jit = numba.njit(cache=True, fastmath=True)
+    _two_period_mean = _jit(_two_period_mean)
+    bang_for_buck_kernel = _jit(bang_for_buck_kernel)
+    cash_conversion_kernel = _jit(cash_conversion_kernel)
@@ -0,0 +1,61 @@
+import json
+import time
+from pathlib import Path
+
+# Financial statements only change quarterly, so a week-old copy is fine.
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+
+class FileCache:
+    """TTL-keyed on-disk cache for per-ticker Yahoo responses.
+
+    DataFrames land in .cache/{ticker}/{kind}.parquet, the info dict in
+    info.json, each next to a {kind}.meta.json holding the fetch timestamp.
+    """
+
+    def __init__(self, root=".cache", ttl=DEFAULT_TTL):
+        self.root = Path(root)
+        self.ttl = ttl
+
+    def _path(self, ticker, kind):
+        suffix = "json" if kind == "info" else "parquet"
+        return self.root / ticker / f"{kind}.{suffix}"
+
+    def _meta_path(self, ticker, kind):
+        return self.root / ticker / f"{kind}.meta.json"
+
+    def _fresh(self, ticker, kind):
+        meta = self._meta_path(ticker, kind)
+        if not meta.exists():
+            return False
+        try:
+            timestamp = json.loads(meta.read_text())["timestamp"]
+        except (ValueError, KeyError):
+            return False
+        return time.time() - timestamp < self.ttl
+
+    def get(self, ticker, kind):
+        # pandas is imported lazily so importing this module stays cheap.
+        import pandas as pd
+
+        if not self._fresh(ticker, kind):
+            return None
+        try:
+            if kind == "info":
+                return json.loads(self._path(ticker, kind).read_text())
+            df = pd.read_parquet(self._path(ticker, kind))
+            # Columns were stringified for parquet; restore the DatetimeIndex.
+            df.columns = pd.to_datetime(df.columns)
+            return df
+        except (OSError, ValueError):
+            return None
+
+    def put(self, ticker, kind, value):
+        self._path(ticker, kind).parent.mkdir(parents=True, exist_ok=True)
+        if kind == "info":
+            self._path(ticker, kind).write_text(json.dumps(value))
+        else:
+            # Parquet requires string column names; statement columns are
+            # fiscal-year Timestamps.
+            value.rename(columns=str).to_parquet(self._path(ticker, kind))
+        self._meta_path(ticker, kind).write_text(json.dumps({"timestamp": time.time()}))
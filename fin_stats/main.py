@@ -1,15 +1,162 @@
+# The heavy third-party imports (pandas, numpy, yfinance, matplotlib, emoji)
+# are deferred to the functions that need them: they cost 1-3s of cold start
+# combined, and paths like --help or --credits touch none of them.
+from __future__ import annotations
+
 import argparse
+import concurrent.futures
+import dataclasses
 import logging
+from typing import TYPE_CHECKING
+
+from fin_stats.cache import FileCache
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Socket timeout (seconds) applied to every Yahoo request; see _make_session.
+FETCH_TIMEOUT = 30
+MAX_FETCH_WORKERS = 16
+
+REQUIRED_LABELS = {
+    "fin": [
+        "Net Income",
+        "Total Revenue",
+        "Cost Of Revenue",
+        "Ebit",
+        "Interest Expense",
+    ],
+    "bs": [
+        "Total Assets",
+        "Total Stockholder Equity",
+        "Total Liab",
+        "Total Current Assets",
+        "Total Current Liabilities",
+        "Inventory",
+        "Net Receivables",
+        "Accounts Payable",
+        "Cash",
+        "Short Term Investments",
+    ],
+}
+
+_FIN_IDX = {name: i for i, name in enumerate(REQUIRED_LABELS["fin"])}
+_BS_IDX = {name: i for i, name in enumerate(REQUIRED_LABELS["bs"])}
+
+
+@dataclasses.dataclass
+class _StockSnapshot:
+    ticker: str
+    info: dict
+    fin_m: np.ndarray
+    bs_m: np.ndarray
+    fin_years: pd.DatetimeIndex
+    bs_years: pd.DatetimeIndex
+    fin_labels: frozenset
+    bs_labels: frozenset
+
+    @classmethod
+    def from_frames(cls, ticker, fin, bs, info):
+        import numpy as np
+
+        # Structure-of-arrays: project each statement down to the ~10
+        # labels this module actually uses and keep only a dense
+        # (n_labels, n_years) float64 matrix per statement, in Yahoo's
+        # natural latest-first column order (every consumer selects by
+        # year). The full frames — dozens of rows per ticker — are not
+        # retained. Labels a ticker does not report (e.g. Inventory for
+        # banks) come out as NaN rows, so remember which were really there.
+        return cls(
+            ticker=ticker,
+            info=info,
+            fin_m=fin.reindex(REQUIRED_LABELS["fin"]).to_numpy(dtype=np.float64),
+            bs_m=bs.reindex(REQUIRED_LABELS["bs"]).to_numpy(dtype=np.float64),
+            fin_years=fin.columns,
+            bs_years=bs.columns,
+            fin_labels=frozenset(fin.index) & set(REQUIRED_LABELS["fin"]),
+            bs_labels=frozenset(bs.index) & set(REQUIRED_LABELS["bs"]),
+        )
+
+    def fin_row(self, name):
+        if name not in self.fin_labels:
+            raise KeyError(name)
+        return self.fin_m[_FIN_IDX[name]]
+
+    def bs_row(self, name):
+        if name not in self.bs_labels:
+            raise KeyError(name)
+        return self.bs_m[_BS_IDX[name]]
+
+
+def _by_year(values, years):
+    # The downstream builders pick one scalar per metric, so a plain dict
+    # keyed by fiscal year (as an int — no string parsing or formatting
+    # anywhere downstream) beats carrying a pandas Series around.
+    return dict(zip((ts.year for ts in years), values))
+
+
+_cache = FileCache()
+
+
+def _make_session(force_refresh=False):
+    import requests_cache
+    from requests.adapters import HTTPAdapter
+
+    class _TimeoutAdapter(HTTPAdapter):
+        # yfinance 0.1.74 issues its requests without a socket timeout, so
+        # one hung connection would stall its worker forever; inject the
+        # bound here at the transport layer, where it can actually fire.
+        def send(self, request, **kwargs):
+            if kwargs.get("timeout") is None:
+                kwargs["timeout"] = FETCH_TIMEOUT
+            return super().send(request, **kwargs)
+
+    # One keep-alive session for the whole basket: TLS handshakes are paid
+    # once per connection instead of once per request, requests-cache
+    # short-circuits repeated URLs at the HTTP layer, and the connection
+    # pool is widened to match the fetch worker count.
+    session = requests_cache.CachedSession(".yf_cache", expire_after=3600)
+    if force_refresh:
+        # --force-refresh already bypasses the FileCache upstream; clear
+        # this layer too so the re-fetch really hits the network.
+        session.cache.clear()
+    adapter = _TimeoutAdapter(
+        pool_connections=MAX_FETCH_WORKERS, pool_maxsize=MAX_FETCH_WORKERS
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-import emoji
-import matplotlib.pyplot as plt
-import pandas as pd
-import yfinance as yf
 
-logging.basicConfig(level=logging.INFO)
+def _make_tickers(symbols, force_refresh=False):
+    import yfinance as yf
 
+    # One yf.Tickers for the whole basket, sharing one HTTP session; its
+    # .tickers attribute is already a dict keyed by (uppercased) symbol.
+    tkrs = yf.Tickers(" ".join(symbols), session=_make_session(force_refresh))
+    return tkrs.tickers
 
-def arg_parser():
+
+def _build_snapshot(ticker, stock, force_refresh=False):
+    fin = bs = info = None
+    if not force_refresh:
+        fin = _cache.get(ticker, "financials")
+        bs = _cache.get(ticker, "balance_sheet")
+        info = _cache.get(ticker, "info")
+    if fin is None:
+        fin = stock.financials
+        _cache.put(ticker, "financials", fin)
+    if bs is None:
+        bs = stock.balance_sheet
+        _cache.put(ticker, "balance_sheet", bs)
+    if info is None:
+        info = stock.info
+        _cache.put(ticker, "info", info)
+    return _StockSnapshot.from_frames(ticker, fin, bs, info)
+
+
+def arg_parser(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Utility to analyse financial statements"
     )
@@ -18,93 +165,113 @@ def arg_parser():
         help="Provide stocks to analyse their financial statements",
         required=False,
     )
-    parser.add_argument("--year", help="Provide financial year", required=False)
+    parser.add_argument(
+        "--year", help="Provide financial year", required=False, type=int
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the analysis figure to this file instead of showing it",
+        required=False,
+    )
+    parser.add_argument(
+        "--report",
+        help="Also write the analysis tables to this parquet file",
+        required=False,
+    )
+    parser.add_argument(
+        "--no-show",
+        help="Do not open an interactive plot window",
+        required=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "--force-refresh",
+        help="Ignore cached Yahoo responses and re-download",
+        required=False,
+        action="store_true",
+    )
     parser.add_argument(
         "--credits",
         help="Credits for fin-stat utility",
         required=False,
         action="store_true",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def bang_for_buck(stock: yf.Ticker):
-    profitability = (
-        stock.financials.loc["Net Income"].iloc[::-1]
-        / stock.financials.loc["Total Revenue"].iloc[::-1]
-    )
-    asset_turn_over = (
-        stock.financials.loc["Total Revenue"].iloc[::-1]
-        / stock.balance_sheet.loc["Total Assets"].iloc[::-1].rolling(window=2).mean()
-    )
-    financial_leverage = (
-        stock.balance_sheet.loc["Total Assets"].iloc[::-1].rolling(window=2).mean()
-        / stock.balance_sheet.loc["Total Stockholder Equity"]
-        .iloc[::-1]
-        .rolling(window=2)
-        .mean()
+def bang_for_buck(snap: _StockSnapshot):
+    from fin_stats._kernels import bang_for_buck_kernel
+
+    prof, ato, fl, roe = bang_for_buck_kernel(
+        snap.fin_row("Total Revenue"),
+        snap.fin_row("Net Income"),
+        snap.bs_row("Total Assets"),
+        snap.bs_row("Total Stockholder Equity"),
     )
-    return_on_equity = profitability * asset_turn_over * financial_leverage
+    fin_years = snap.fin_years
+    bs_years = snap.bs_years
     return {
-        "name": stock.ticker,
-        "profitability": profitability,
-        "asset_turn_over": asset_turn_over,
-        "financial_leverage": financial_leverage,
-        "return_on_equity": return_on_equity,
+        "name": snap.ticker,
+        "profitability": _by_year(prof, fin_years),
+        "asset_turn_over": _by_year(ato, fin_years[:-1]),
+        "financial_leverage": _by_year(fl, bs_years[:-1]),
+        "return_on_equity": _by_year(roe, fin_years[:-1]),
     }
 
 
-def cash_conversion_cycle(stock: yf.Ticker):
+def cash_conversion_cycle(snap: _StockSnapshot):
+    from fin_stats._kernels import cash_conversion_kernel
+
+    # Banks, insurers and most pure-software firms carry no Inventory row;
+    # short-circuit instead of letting the arithmetic raise below.
+    if "Inventory" not in snap.bs_labels:
+        logging.warning(
+            f"{snap.ticker}: no Inventory row, skipping cash conversion cycle"
+        )
+        return {"name": snap.ticker, "cash_conversion_cycle": None}
     try:
-        inventory_turn_over_days = 365 / (
-            stock.financials.loc["Cost Of Revenue"].iloc[::-1]
-            / stock.balance_sheet.loc["Inventory"].iloc[::-1].rolling(window=2).mean()
+        ccc = cash_conversion_kernel(
+            snap.fin_row("Cost Of Revenue"),
+            snap.fin_row("Total Revenue"),
+            snap.bs_row("Inventory"),
+            snap.bs_row("Net Receivables"),
+            snap.bs_row("Accounts Payable"),
         )
-        accounts_receivable_turn_over_days = 365 / (
-            stock.financials.loc["Total Revenue"].iloc[::-1]
-            / stock.balance_sheet.loc["Net Receivables"]
-            .iloc[::-1]
-            .rolling(window=2)
-            .mean()
+    except KeyError as exc:
+        logging.warning(
+            f"{snap.ticker}: missing statement row {exc}, "
+            "skipping cash conversion cycle"
         )
-        accounts_payable_turn_over_days = 365 / (
-            stock.financials.loc["Cost Of Revenue"].iloc[::-1]
-            / stock.balance_sheet.loc["Accounts Payable"]
-            .iloc[::-1]
-            .rolling(window=2)
-            .mean()
+        return {"name": snap.ticker, "cash_conversion_cycle": None}
+    return {
+        "name": snap.ticker,
+        "cash_conversion_cycle": _by_year(ccc, snap.fin_years[:-1]),
+    }
+
+
+def liquidity_and_solvency(snap: _StockSnapshot):
+    tcl = snap.bs_row("Total Current Liabilities")
+    liabilities_to_equity = _by_year(
+        snap.bs_row("Total Liab") / snap.bs_row("Total Stockholder Equity"),
+        snap.bs_years,
+    )
+    interest_coverage_ratio = _by_year(
+        snap.fin_row("Ebit") / snap.fin_row("Interest Expense"),
+        snap.fin_years,
+    )
+    current_ratio = _by_year(snap.bs_row("Total Current Assets") / tcl, snap.bs_years)
+    quick_ratio = _by_year(
+        (
+            snap.bs_row("Cash")
+            + snap.bs_row("Short Term Investments")
+            + snap.bs_row("Net Receivables")
         )
-        return {
-            "name": stock.ticker,
-            "cash_conversion_cycle": inventory_turn_over_days
-            + accounts_receivable_turn_over_days
-            - accounts_payable_turn_over_days,
-        }
-    except Exception as e:
-        return {"name": stock.ticker, "cash_conversion_cycle": 0}
-
-
-def liquidity_and_solvency(stock: yf.Ticker):
-    liabilities_to_equity = (
-        stock.balance_sheet.loc["Total Liab"].iloc[::-1]
-        / stock.balance_sheet.loc["Total Stockholder Equity"].iloc[::-1]
-    )
-    interest_coverage_ratio = (
-        stock.financials.loc["Ebit"].iloc[::-1]
-        / stock.financials.loc["Interest Expense"].iloc[::-1]
-    )
-    current_ratio = (
-        stock.balance_sheet.loc["Total Current Assets"].iloc[::-1]
-        / stock.balance_sheet.loc["Total Current Liabilities"].iloc[::-1]
-    )
-    quick_ratio = (
-        stock.balance_sheet.loc["Cash"].iloc[::-1]
-        + stock.balance_sheet.loc["Short Term Investments"].iloc[::-1]
-        + stock.balance_sheet.loc["Net Receivables"].iloc[::-1]
-    ) / stock.balance_sheet.loc["Total Current Liabilities"].iloc[::-1]
+        / tcl,
+        snap.bs_years,
+    )
 
     return {
-        "name": stock.ticker,
+        "name": snap.ticker,
         "liquidity": {"current_ratio": current_ratio, "quick_ratio": quick_ratio},
         "solvency": {
             "liabilities_to_equity": liabilities_to_equity,
@@ -112,109 +279,192 @@ def liquidity_and_solvency(stock: yf.Ticker):
         },
     }
 
-def equity_analysis(stock: yf.Ticker):
+def equity_analysis(snap: _StockSnapshot):
     return {
-        "name": stock.ticker,
-        "pe": stock.info['forwardPE']
+        "name": snap.ticker,
+        "pe": snap.info['forwardPE']
     }
 
 
+def process_one(ticker, stock, force_refresh=False):
+    # The snapshot (served from the on-disk cache when fresh) is all the
+    # analysis functions ever see.
+    snap = _build_snapshot(ticker, stock, force_refresh)
+    return (
+        bang_for_buck(snap),
+        cash_conversion_cycle(snap),
+        liquidity_and_solvency(snap),
+        equity_analysis(snap),
+    )
+
+
+def _extract(stock, key_path):
+    value = stock
+    for key in key_path:
+        value = value[key]
+    return value
+
+
+def _resolve_year(stocks, key_path, user_year):
+    # Default to the newest fiscal year reported by any stock — results
+    # arrive in completion order, so "the first stock" would make the
+    # default nondeterministic. Warn about tickers whose fiscal year-end
+    # means they do not report that year; the builders emit NaN for their
+    # cells rather than crashing on them.
+    year = user_year or max(max(_extract(s, key_path)) for s in stocks)
+    missing = [s["name"] for s in stocks if year not in _extract(s, key_path)]
+    if missing:
+        logging.warning(f"Fiscal year {year} not reported by: {missing}")
+    return year
+
+
 def cash_conversion_cycle_df(stocks, year):
-    p = {}
+    import numpy as np
+    import pandas as pd
+
     i = ["cash_conversion_cycle"]
-    try:
-        for s in stocks:
-            if year is None:
-                year = str(s["cash_conversion_cycle"].index.max().year)
-            p[s["name"]] = s["cash_conversion_cycle"].loc[year].values[0]
-        logging.info(f"Cash conversion cycle: {p}")
-    except Exception as e:
-        p[s["name"]] = 0
-    return pd.DataFrame(p, index=i).transpose()
+    # Tickers that reported no inventory carry None; drop them instead of
+    # plotting a misleading zero bar.
+    stocks = [s for s in stocks if s["cash_conversion_cycle"] is not None]
+    if stocks:
+        year = _resolve_year(stocks, ("cash_conversion_cycle",), year)
+        # _resolve_year has warned about tickers missing that year; drop
+        # just those and keep the real values for the rest.
+        stocks = [s for s in stocks if year in s["cash_conversion_cycle"]]
+    if not stocks:
+        df = pd.DataFrame(columns=i)
+    else:
+        arr = np.stack([[s["cash_conversion_cycle"][year]] for s in stocks])
+        df = pd.DataFrame(arr, index=[s["name"] for s in stocks], columns=i)
+    logging.info(f"Cash conversion cycle: {df.to_dict('index')}")
+    return df
 
 
 def bang_for_buck_df(stocks, year):
-    p = {}
+    import numpy as np
+    import pandas as pd
+
     i = ["profitability", "asset_turn_over", "financial_leverage", "return_on_equity"]
-    for s in stocks:
-        if year is None:
-            year = str(s["profitability"].index.max().year)
-        p[s["name"]] = [
-            s["profitability"].loc[year].values[0],
-            s["asset_turn_over"].loc[year].values[0],
-            s["financial_leverage"].loc[year].values[0],
-            s["return_on_equity"].loc[year].values[0],
+    year = _resolve_year(stocks, ("profitability",), year)
+    arr = np.stack(
+        [
+            [
+                s["profitability"].get(year, np.nan),
+                s["asset_turn_over"].get(year, np.nan),
+                s["financial_leverage"].get(year, np.nan),
+                s["return_on_equity"].get(year, np.nan),
+            ]
+            for s in stocks
         ]
-    logging.info(f"Bang for the buck analysis: {p}")
-    return pd.DataFrame(p, index=i).transpose()
+    )
+    df = pd.DataFrame(arr, index=[s["name"] for s in stocks], columns=i)
+    logging.info(f"Bang for the buck analysis: {df.to_dict('index')}")
+    return df
 
 
 def liquidity_and_solvency_df(stocks, year):
-    p = {}
+    import numpy as np
+    import pandas as pd
+
     i = [
         "current_ratio",
         "quick_ratio",
         "liabilities_to_equity",
         "interest_coverage_ratio",
     ]
-    for s in stocks:
-        if year is None:
-            year = str(s["liquidity"]["current_ratio"].index.max().year)
-        p[s["name"]] = [
-            s["liquidity"]["current_ratio"].loc[year].values[0],
-            s["liquidity"]["quick_ratio"].loc[year].values[0],
-            s["solvency"]["liabilities_to_equity"].loc[year].values[0],
-            s["solvency"]["interest_coverage_ratio"].loc[year].values[0],
+    year = _resolve_year(stocks, ("liquidity", "current_ratio"), year)
+    arr = np.stack(
+        [
+            [
+                s["liquidity"]["current_ratio"].get(year, np.nan),
+                s["liquidity"]["quick_ratio"].get(year, np.nan),
+                s["solvency"]["liabilities_to_equity"].get(year, np.nan),
+                s["solvency"]["interest_coverage_ratio"].get(year, np.nan),
+            ]
+            for s in stocks
         ]
-    logging.info(f"Liquidity and Solvency: {p}")
-    return pd.DataFrame(p, index=i).transpose()
+    )
+    df = pd.DataFrame(arr, index=[s["name"] for s in stocks], columns=i)
+    logging.info(f"Liquidity and Solvency: {df.to_dict('index')}")
+    return df
 
 def equity_analysis_df(stocks):
+    import pandas as pd
+
     p = {}
     i = ["PE"]
     for s in stocks:
-        p[s["name"]] = s["pe"]
+        p[s["name"]] = [s["pe"]]
     logging.info(f"Equity Analysis: {p}")
-    return pd.DataFrame(p, index=i).transpose()
+    return pd.DataFrame.from_dict(p, orient="index", columns=i)
 
-def plot(b_df, c_df, l_df, e_df):
+def plot(b_df, c_df, l_df, e_df, output=None, show=True):
+    # Importing matplotlib here keeps it off the non-plotting code paths;
+    # the Agg backend skips GUI toolkit initialization in headless runs.
+    if output or not show:
+        import matplotlib
+
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    # One wide frame, one loop: the four panels only differ in which
+    # column group they draw and how they are labelled.
+    wide = pd.concat([b_df, c_df, l_df, e_df], axis=1, keys=["bfb", "ccc", "ls", "eq"])
+    panels = [
+        ("bfb", "Bank for the Buck", "Ratios"),
+        ("ccc", "Cash Conversion", "Number of Days"),
+        ("ls", "Liquidity and Solvency", "Ratios"),
+        ("eq", "Equity Analysis", "Price to Earnings"),
+    ]
     fig, axs = plt.subplots(nrows=2, ncols=2, figsize=(16, 9))
     fig.suptitle("Financial Statements Analysis")
-    b_df.plot(
-        ax=axs[0,0], kind="bar", title="Bank for the Buck", xlabel="Stocks", ylabel="Ratios"
-    )
-    c_df.plot(
-        ax=axs[0,1],
-        kind="bar",
-        title="Cash Conversion",
-        xlabel="Stocks",
-        ylabel="Number of Days",
-    )
-    l_df.plot(
-        ax=axs[1,0],
-        kind="bar",
-        title="Liquidity and Solvency",
-        xlabel="Stocks",
-        ylabel="Ratios",
-    )
-    e_df.plot(
-        ax=axs[1,1],
-        kind="bar",
-        title="Equity Analysis",
-        xlabel="Stocks",
-        ylabel="Price to Earnings",
+    for ax, (key, title, ylabel) in zip(axs.flat, panels):
+        wide[key].plot(
+            ax=ax,
+            kind="bar",
+            title=title,
+            xlabel="Stocks",
+            ylabel=ylabel,
+            rot=45,
+        )
+    if output:
+        fig.savefig(output, dpi=100, bbox_inches="tight")
+    elif show:
+        plt.show()
+
+
+def _write_parquet(b_df, c_df, l_df, e_df, path):
+    import pandas as pd
+
+    # One long frame with a metric index level, written in a single
+    # columnar pass; pandas' parquet writer releases the GIL, so this can
+    # run alongside the matplotlib rendering on the main thread.
+    report = pd.concat(
+        {
+            "bang_for_buck": b_df,
+            "cash_conversion_cycle": c_df,
+            "liquidity_and_solvency": l_df,
+            "equity_analysis": e_df,
+        },
+        names=["metric", "ticker"],
     )
-    plt.show()
+    report.reset_index().to_parquet(path)
+    logging.info(f"Wrote analysis report to {path}")
 
 
 def plot_sankey_earnings():
     pass
 
 
-def app():
-# if __name__ == "__main__":
-    args = arg_parser()
+def app(argv: list[str] | None = None):
+    # Configured here rather than at import time so importing this module
+    # as a library does not reconfigure the caller's root logger.
+    logging.basicConfig(level=logging.INFO)
+    args = arg_parser(argv)
     if args.analyse_stocks_financial_statements:
+        import requests
+
         logging.info(
             f"Analyzing financial statements for: {args.analyse_stocks_financial_statements.upper()}"
         )
@@ -223,20 +473,47 @@ def app():
         liquidity_and_solvency_res = []
         equity_analysis_res = []
         tickers = args.analyse_stocks_financial_statements.upper().split(",")
-        stocks = []
-        for t in tickers:
-            stocks.append(yf.Ticker(t))
-        for stock in stocks:
-            bank_for_buck_res.append(bang_for_buck(stock))
-            cash_conversion_cycle_res.append(cash_conversion_cycle(stock))
-            liquidity_and_solvency_res.append(liquidity_and_solvency(stock))
-            equity_analysis_res.append(equity_analysis(stock))
+        ticker_objs = _make_tickers(tickers, args.force_refresh)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(MAX_FETCH_WORKERS, len(tickers))
+        ) as pool:
+            futures = {
+                pool.submit(process_one, t, ticker_objs[t], args.force_refresh): t
+                for t in tickers
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    b, c, l, e = future.result()
+                except (requests.RequestException, KeyError) as exc:
+                    logging.warning(f"Skipping {futures[future]}: {exc}")
+                    continue
+                bank_for_buck_res.append(b)
+                cash_conversion_cycle_res.append(c)
+                liquidity_and_solvency_res.append(l)
+                equity_analysis_res.append(e)
+        if not bank_for_buck_res:
+            # Every ticker was skipped (bad symbols, network trouble, ...);
+            # exit with a message instead of tripping over empty results.
+            logging.error(f"No analysable tickers among: {tickers}")
+            raise SystemExit(1)
         b_df = bang_for_buck_df(bank_for_buck_res, args.year)
         c_df = cash_conversion_cycle_df(cash_conversion_cycle_res, args.year)
         l_df = liquidity_and_solvency_df(liquidity_and_solvency_res, args.year)
         e_df = equity_analysis_df(equity_analysis_res)
-        plot(b_df, c_df, l_df, e_df)
+        if args.report:
+            # Serializing the tables and rendering the figure are
+            # independent; overlap them.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                report = pool.submit(
+                    _write_parquet, b_df, c_df, l_df, e_df, args.report
+                )
+                plot(b_df, c_df, l_df, e_df, output=args.output, show=not args.no_show)
+                report.result()
+        else:
+            plot(b_df, c_df, l_df, e_df, output=args.output, show=not args.no_show)
     elif args.credits:
+        import emoji
+
         print(
             emoji.emojize(
                 """
@@ -248,3 +525,7 @@ def app():
 """
             )
         )
+
+
+if __name__ == "__main__":
+    app()